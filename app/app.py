@@ -1,5 +1,6 @@
 # app.py - Main entry point for the Dash app.
 
+import os
 from dash import Dash
 from layout import *
 from callbacks import *
@@ -12,17 +13,20 @@ def create_app() -> Dash:
         external_stylesheets=[dbc.themes.FLATLY, dbc.icons.BOOTSTRAP]
     )
     app.title = "Exploring Academic World"
-    app.layout = create_layout()
+    app.layout = create_layout(get_all_institutes())
     return app
 
 
 if __name__ == "__main__":
     app = create_app()
 
+    # Debug mode and the hot reloader are opt-in (DASH_DEBUG=1) so production runs a single process
+    debug = os.getenv("DASH_DEBUG", "0") == "1"
+
     app.run(
-        debug=True,
-        use_reloader=True,
-        dev_tools_hot_reload=True,
+        debug=debug,
+        use_reloader=debug,
+        dev_tools_hot_reload=debug,
         host="0.0.0.0",
         port=8050
     )
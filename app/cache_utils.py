@@ -0,0 +1,31 @@
+# cache_utils.py - In-process TTL caching shared by the database utility modules.
+
+from typing import Any, Callable
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+import threading
+import functools
+
+# Guards every TTLCache used with ttl_cached (cachetools caches are not thread-safe)
+CACHE_LOCK = threading.Lock()
+
+
+def ttl_cached(cache: TTLCache) -> Callable:
+    """Memoize a query function in the given TTL cache, keyed on its name and arguments.
+
+    Empty results are not cached, so a failed query (which returns []/0) is retried next time.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            key = hashkey(func.__name__, *args)
+            with CACHE_LOCK:
+                if key in cache:
+                    return cache[key]
+            result = func(*args)
+            if result:
+                with CACHE_LOCK:
+                    cache[key] = result
+            return result
+        return wrapper
+    return decorator
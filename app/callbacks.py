@@ -124,6 +124,16 @@ def update_keyword_pie_chart(keywords: List[str]) -> Any:
     title="Current Favorite Keywords")
 
 
+# 2.6 Widget Two: MySQL Controller - Add Dropdown Options (resolved on page load)
+@callback(
+    Output("widget-two-keyword-add-dropdown", "options"),
+    Input("interval-two", "n_intervals")
+)
+def update_keyword_add_options(n: int) -> List[dict]:
+    """Fill the add-keyword dropdown with all keywords from MySQL."""
+    return [{"label": kw, "value": kw} for kw in get_all_keywords()]
+
+
 # 3.1 Widget Three: MySQL Table
 @callback(
     [Output("widget-three", "children"),
@@ -138,8 +148,10 @@ def widget_three(selected_keyword: str, n: int) -> Tuple[Any, Any]:
         return dash.no_update, dash.no_update
 
     # Get updated table
-    faculty_count = get_faculty_count()
-    faculty_data = find_faculty_relevant_to_keyword(selected_keyword)
+    faculty_count, faculty_data = run_parallel([
+        get_faculty_count,
+        lambda: find_faculty_relevant_to_keyword(selected_keyword)
+    ])
     df = pd.DataFrame(faculty_data, columns=["ID", "Faculty", "University"])
     updated_table = create_data_table(df)
 
@@ -177,8 +189,10 @@ def delete_faculty_callback(n_clicks: int, n_intervals: int,
     message = f"ID {faculty_id} deleted." if success else f"Delete failed."
 
     # Get updated table
-    faculty_count = get_faculty_count()
-    faculty_data = find_faculty_relevant_to_keyword(selected_keyword)
+    faculty_count, faculty_data = run_parallel([
+        get_faculty_count,
+        lambda: find_faculty_relevant_to_keyword(selected_keyword)
+    ])
     df = pd.DataFrame(faculty_data, columns=["ID", "Faculty", "University"])
     updated_table = create_data_table(df)
 
@@ -212,8 +226,10 @@ def restore_faculty_callback(n_clicks: int, n_intervals: int,
     message = "Faculty restored." if success else "Restore failed."
 
     # Get updated table
-    faculty_count = get_faculty_count()
-    faculty_data = find_faculty_relevant_to_keyword(selected_keyword)
+    faculty_count, faculty_data = run_parallel([
+        get_faculty_count,
+        lambda: find_faculty_relevant_to_keyword(selected_keyword)
+    ])
     df = pd.DataFrame(faculty_data, columns=["ID", "Faculty", "University"])
     updated_table = create_data_table(df)
 
@@ -221,6 +237,16 @@ def restore_faculty_callback(n_clicks: int, n_intervals: int,
     return message, faculty_count, False, 0, updated_table
 
 
+# 3.4 Widget Three: MySQL Table - Delete Faculty Input Max (resolved on page load)
+@callback(
+    Output("widget-three-faculty-id-input", "max"),
+    Input("interval-three", "n_intervals")
+)
+def update_faculty_id_max(n: int) -> int:
+    """Set the Faculty ID input's upper bound from the current faculty count."""
+    return get_faculty_count()
+
+
 # 4.1 Widget Four: MongoDB Bar Chart (with MySQL option) - Database Dropdown
 @callback(
     Output("widget-four-dropdown-affiliation", "options"),
@@ -281,8 +307,10 @@ def widget_five(selected_university: str, n: int) -> Tuple[Any, Any]:
         return dash.no_update, dash.no_update  # No keyword selected, return no update for table, update for count
 
     # Get updated table
-    keyword_count = get_keyword_count()
-    keyword_data = faculty_interested_in_keywords(selected_university)
+    keyword_count, keyword_data = run_parallel([
+        get_keyword_count,
+        lambda: faculty_interested_in_keywords(selected_university)
+    ])
     df_keyword_data = pd.DataFrame(keyword_data, columns=["ID", "Keyword", "Faculty Count"])
     updated_table = create_data_table(df_keyword_data)
 
@@ -320,8 +348,10 @@ def delete_keyword_callback(n_clicks: int, n_intervals: int,
     message = f"ID {keyword_id} deleted." if success else f"Delete failed."
 
     # Get updated table
-    keyword_count = get_keyword_count()
-    keyword_data = faculty_interested_in_keywords(selected_university)
+    keyword_count, keyword_data = run_parallel([
+        get_keyword_count,
+        lambda: faculty_interested_in_keywords(selected_university)
+    ])
     df_keyword_data = pd.DataFrame(keyword_data, columns=["ID", "Keyword", "Faculty Count"])
     updated_table = create_data_table(df_keyword_data)
 
@@ -355,13 +385,15 @@ def restore_keyword_callback(n_clicks: int, n_intervals: int,
     message = "Keyword restored." if success else "Restore failed."
 
     # Get updated table
-    keyword_count = get_keyword_count()
-    keyword_data = faculty_interested_in_keywords(selected_university)
+    keyword_count, keyword_data = run_parallel([
+        get_keyword_count,
+        lambda: faculty_interested_in_keywords(selected_university)
+    ])
     df_keyword_data = pd.DataFrame(keyword_data, columns=["ID", "Keyword", "Faculty Count"])
     updated_table = create_data_table(df_keyword_data)
 
     # Show message, update count, enable dcc.Interval (triggers itself again), reset n_intervals to 0 which will tick to 1
-    return message, get_keyword_count(), False, 0, updated_table
+    return message, keyword_count, False, 0, updated_table
 
 
 # 6.1 Widget Six: Neo4j Sunburst Chart
@@ -410,5 +442,5 @@ def show_collaboration_details(clickData: dict) -> Any:
     # Build HTML header and table
     return html.Div([
         create_section_header("University Details:", clicked_university),
-        create_info_table(["Name", "Total Faculty", "Logo"], result)
+        create_info_table(["Name", "Total Faculty", "Logo"], [result])
     ])
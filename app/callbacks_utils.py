@@ -1,9 +1,23 @@
 # callback_graph.py - Utility functions used during callbacks.
 
-from typing import Any, List, Tuple, Union, Sequence
+from typing import Any, Callable, List, Tuple, Union, Sequence
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from dash import dash_table, html
 import plotly.express as px
+from mysql_utils import DB_POOL_SIZE
+
+
+# Shared worker pool for running independent database queries concurrently
+# (uses at most half the MySQL pool, leaving the rest for callbacks running in parallel)
+_EXECUTOR = ThreadPoolExecutor(max_workers=max(1, min(8, DB_POOL_SIZE // 2)))
+
+
+# Parallel queries
+def run_parallel(callables: Sequence[Callable[[], Any]]) -> List[Any]:
+    """Run independent zero-argument query functions concurrently and return their results in order."""
+    futures = [_EXECUTOR.submit(func) for func in callables]
+    return [future.result() for future in futures]
 
 
 # Bar chart
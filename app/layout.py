@@ -1,11 +1,12 @@
 # layout.py - Layout components for the Dash app.
 
+from typing import List
 from dash import html
 import dash_bootstrap_components as dbc
 from layout_utils import *
 
 
-def create_layout() -> html.Div:
+def create_layout(institutes: List[str]) -> html.Div:
     """Creates a Dash app layout in a 3-row * 2-column format with a modern bootstrap theme."""
 
     # Helper function to wrap widgets in a modern card style
@@ -80,6 +81,7 @@ def create_layout() -> html.Div:
                                 delete_button_id="widget-two-keyword-delete-btn",
                                 restore_button_id="widget-two-keyword-restore-btn",
                                 graph_id="widget-two-keyword-pie",
+                                interval_id="interval-two",
                                 default_keywords=[
                                     "artificial intelligence",
                                     "deep learning",
@@ -119,7 +121,7 @@ def create_layout() -> html.Div:
                                                      button_id="widget-three-delete-button",
                                                      status_id="widget-three-delete-status",
                                                      interval_id="widget-three-clear-message-interval",
-                                                     max_value = get_faculty_count(),
+                                                     max_value=None,  # Filled in by callback on page load
                                                      input_type="number",
                                                      placeholder="Enter ID"),
 
@@ -161,7 +163,7 @@ def create_layout() -> html.Div:
                                          table_id="widget-five",
                                          control_type="dropdown",
                                          control_id="widget-five-dropdown",
-                                         control_options={"options": get_all_institutes(), "placeholder": "Select a University"},
+                                         control_options={"options": institutes, "placeholder": "Select a University"},
                                          layout="two-col",
                                          interval_id="interval-five",
 
@@ -198,7 +200,7 @@ def create_layout() -> html.Div:
                                         graph_type="sunburst",
                                         control_type="dropdown",
                                         control_id="widget-six-dropdown",
-                                        control_options={"options": get_all_institutes(), "placeholder": "Select a University"},
+                                        control_options={"options": institutes, "placeholder": "Select a University"},
                                         interval_id="interval-six",
                                         details_id="widget-six-details")
                         )
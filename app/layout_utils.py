@@ -212,6 +212,7 @@ class ControlWidget(html.Div):
                  restore_button_id: str,
                  graph_id: str,
                  default_keywords: List[str],
+                 interval_id: Optional[str] = None,
                  **kwargs):
 
         children: List[Any] = [html.H3(title, style={"textAlign": "center", "marginBottom": "20px"})]
@@ -222,7 +223,7 @@ class ControlWidget(html.Div):
                 html.Div([
                     dcc.Dropdown(
                         id=dropdown_id,
-                        options=[{"label": kw, "value": kw} for kw in get_all_keywords()],
+                        options=[],  # Filled in by callback on page load
                         placeholder="Select a keyword...",
                         style={"width": "100%"}
                     )
@@ -285,6 +286,10 @@ class ControlWidget(html.Div):
         # Store for active keywords
         children.append(dcc.Store(id=store_id, data=default_keywords))
 
+        # Interval: fires once on page load to fill the keyword dropdown
+        children.append(dcc.Interval(id=interval_id if interval_id else f"{dropdown_id}-interval",
+                                     interval=10 * 1000, n_intervals=0, disabled=True))
+
         # Pie chart to visualize selected keywords
         children.append(
             dcc.Graph(id=graph_id, style={"marginTop": "10px"})
@@ -1,165 +1,271 @@
 # mongodb_utils.py - Utility functions for MongoDB database operations.
 
-from typing import List, Tuple
-from pymongo import MongoClient
+from typing import List, Tuple, Optional
+import pymongo
+from pymongo import MongoClient, IndexModel
+from pymongo.database import Database
+from cachetools import TTLCache
+from cache_utils import ttl_cached, CACHE_LOCK
 import os
 import certifi
 import time
+import atexit
+import threading
+from operator import itemgetter
 
-# Global MongoDB client (initialized once)
+# Global MongoDB client (created lazily on first use, shared by all queries)
 MONGO_URI = os.getenv("MONGODB_URI")
 DATABASE_NAME = "academicworld"
-client = MongoClient(MONGO_URI)
-db = client[DATABASE_NAME]
+KEYWORD_YEAR_COUNTS = "keyword_year_counts"  # Precomputed (keyword, year, count) rows for Widget One
+_CLIENT: Optional[MongoClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+# Indexes only need to be created once per process
+_INDEXES_READY = False
+
+
+def _ensure_indexes(db: Database) -> None:
+    """Create the indexes used by the widget queries (runs once per process)."""
+    global _INDEXES_READY
+    if _INDEXES_READY:
+        return
+
+    # One create_indexes command per collection instead of one round-trip per index
+    db.faculty.create_indexes([
+        IndexModel([("affiliation.name", 1)]),  # Optimizes filtering by university
+        IndexModel([("publications", 1)]),  # Optimizes lookup by publications array
+        IndexModel([("publications", 1), ("affiliation.name", 1)])  # Optimizes collaboration lookup
+    ])
+    db.publications.create_indexes([
+        IndexModel([("id", 1)]),  # Optimizes join
+        IndexModel([("keywords.name", 1)]),  # Optimizes keyword search
+        IndexModel([("year", 1)]),  # Optimizes year-based search
+        IndexModel([("keywords.score", 1), ("numCitations", 1)])  # Optimizes calculations
+    ])
+    db[KEYWORD_YEAR_COUNTS].create_index([("year", 1), ("keyword", 1)], unique=True)  # Optimizes year-based search
+    _INDEXES_READY = True
+
+
+def refresh_keyword_year_counts(db: Database) -> None:
+    """Recompute the (keyword, year, count) collection from all publications."""
+    pipeline = [
+        { "$unwind": "$keywords" },
+        { "$match": { "keywords.name": { "$ne": None }, "year": { "$ne": None } } },  # Skip publications without a keyword name or year
+        { "$group": { "_id": { "keyword": "$keywords.name", "year": "$year" }, "count": { "$sum": 1 } } },
+        { "$project": { "_id": 0, "keyword": "$_id.keyword", "year": "$_id.year", "count": 1 } },
+        # $out swaps in the new collection atomically (keeping its indexes), so stale pairs are dropped
+        { "$out": KEYWORD_YEAR_COUNTS }
+    ]
+    # Full rebuild scans every publication, so allow longer than the interactive socket timeout
+    with pymongo.timeout(300):
+        db.publications.aggregate(pipeline)
+
+
+def _build_keyword_year_counts_in_background(db: Database) -> None:
+    """Build keyword_year_counts in a daemon thread if it is still empty (e.g. before the first nightly run)."""
+    def build() -> None:
+        try:
+            if db[KEYWORD_YEAR_COUNTS].estimated_document_count() == 0:
+                refresh_keyword_year_counts(db)
+                print(f"Built '{KEYWORD_YEAR_COUNTS}' collection")
+        except Exception as e:
+            print(f"Building '{KEYWORD_YEAR_COUNTS}' failed (Widget One falls back to publications):", e)
+
+    threading.Thread(target=build, name="keyword-year-counts", daemon=True).start()
+
 
+def get_db(build_missing: bool = True) -> Database:
+    """Return the shared MongoDB database handle, connecting on first use.
 
-def get_mongo_connection():
-    """Create and return a new MongoDB client and database connection."""
+    pymongo's MongoClient keeps its own connection pool, so a single client is
+    reused across all callbacks instead of reconnecting per query. Pass
+    build_missing=False to skip the background keyword_year_counts build (e.g. when
+    the caller is about to refresh that collection itself).
+    """
+    global _CLIENT
     max_retries = 3
     retry_delay_seconds = 2
 
     for attempt in range(1, max_retries + 1):
-        try:
-            # Use TLS/SSL configuration with certifi
-            client = MongoClient(
-                MONGO_URI,
-                serverSelectionTimeoutMS=30000,  # 30-second timeout
-                tls=True,
-                tlsCAFile=certifi.where()
-            )
-            print(f"MongoDB connection established (Attempt {attempt}/{max_retries})")
-            return client, client[DATABASE_NAME]
-        except Exception as e:
-            print(f"MongoDB connection failed (Attempt {attempt}/{max_retries}): {e}")
-            if attempt < max_retries:
-                print(f"Retrying in {retry_delay_seconds} seconds...")
-                time.sleep(retry_delay_seconds)
-            else:
-                print("Max retries reached. Raising exception.")
-                raise
-
-
-def close_mongo_connection(client):
-    """Safely close MongoDB client connection."""
-    if client:
-        client.close()
+        with _CLIENT_LOCK:
+            if _CLIENT is not None:
+                return _CLIENT[DATABASE_NAME]
+
+            client = None
+            try:
+                # Use TLS/SSL configuration with certifi
+                client = MongoClient(
+                    MONGO_URI,
+                    serverSelectionTimeoutMS=3000,  # 3-second timeout, fail fast in callbacks
+                    connectTimeoutMS=3000,
+                    socketTimeoutMS=10000,
+                    retryReads=True,
+                    maxPoolSize=50,
+                    tls=True,
+                    tlsCAFile=certifi.where()
+                )
+                db = client[DATABASE_NAME]
+                _ensure_indexes(db)
+                _CLIENT = client
+                if build_missing:
+                    _build_keyword_year_counts_in_background(db)
+                print(f"MongoDB connection established (Attempt {attempt}/{max_retries})")
+                return db
+            except Exception as e:
+                print(f"MongoDB connection failed (Attempt {attempt}/{max_retries}): {e}")
+                if client is not None:
+                    client.close()  # Release the failed attempt's pool and monitor threads
+                if attempt == max_retries:
+                    print("Max retries reached. Raising exception.")
+                    raise
+
+        # Sleep outside the lock so other callers are not blocked during the back-off
+        print(f"Retrying in {retry_delay_seconds} seconds...")
+        time.sleep(retry_delay_seconds)
+
+    # This should never be reached, but satisfies the type checker
+    raise RuntimeError("Failed to establish MongoDB connection")
+
+
+def close_mongo_connection() -> None:
+    """Close the shared MongoDB client (registered to run at process exit)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        _CLIENT.close()
+        _CLIENT = None
+
+
+atexit.register(close_mongo_connection)
+
+
+# In-process TTL caches for read-only queries (the underlying data changes at most daily)
+_QUERY_CACHE: TTLCache = TTLCache(maxsize=256, ttl=300)  # 5 minutes
+_KRC_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)  # keyed on (keyword, affiliation)
+
+
+def flush_mongo_caches() -> None:
+    """Drop all cached MongoDB query results."""
+    with CACHE_LOCK:
+        _QUERY_CACHE.clear()
+        _KRC_CACHE.clear()
 
 
 def get_all_collections() -> list:
     """Fetch all collection names from the MongoDB database."""
-    client = None
     try:
-        client, db = get_mongo_connection()
+        db = get_db()
         return db.list_collection_names()
     except Exception as e:
         print("MongoDB connection error:", e)
         return []
-    finally:
-        close_mongo_connection(client)
 
 
 def get_collection_count(collection_name: str) -> int:
     """Fetch document count for the selected collection."""
-    client = None
     try:
-        client, db = get_mongo_connection()
+        db = get_db()
         count = db[collection_name].count_documents({})
         return count if count is not None else 0  # Ensure valid int count
     except Exception as e:
         print(f"Error fetching count for collection '{collection_name}':", e)
         return 0
-    finally:
-        close_mongo_connection(client)
 
 
+@ttl_cached(_QUERY_CACHE)
 def get_all_affiliations() -> List[str]:
     """Fetch all affiliations from the MongoDB database."""
-    client = None
     try:
-        client, db = get_mongo_connection()
+        db = get_db()
         result = db.faculty.distinct("affiliation.name")
         return result
     except Exception as e:
         print("Error fetching affiliations:", e)
         return []
-    finally:
-        close_mongo_connection(client)
 
 
+@ttl_cached(_QUERY_CACHE)
 def get_all_keywords_mongo() -> List[str]:
     """Fetch all keywords from the MongoDB database."""
-    client = None
     try:
-        client, db = get_mongo_connection()
-        result = db.publications.distinct("keywords.name")
-        return result
+        db = get_db()
+        # Stream distinct keywords via $group instead of distinct(), which is capped at 16MB
+        pipeline = [
+            { "$unwind": "$keywords" },
+            { "$group": { "_id": "$keywords.name" } }
+        ]
+        query_result = db.publications.aggregate(pipeline, batchSize=1000, allowDiskUse=True)
+        return [keyword["_id"] for keyword in query_result if keyword["_id"] is not None]
     except Exception as e:
         print("Error fetching keywords:", e)
         return []
-    finally:
-        close_mongo_connection(client)
 
 
 # For 1. Widget One: MongoDB Bar Chart
+@ttl_cached(_QUERY_CACHE)
 def find_most_popular_keywords_mongo(year: int) -> List[Tuple[str, int]]:
     """Find the top-10 most popular keywords in publications since the given year."""
-    client = None
     try:
-        client, db = get_mongo_connection()
+        db = get_db()
 
-        # Create indexes for optimized query performance
-        db.publications.create_index([("keywords.name", 1)])  # Optimizes keyword search
-        db.publications.create_index([("year", 1)])  # Optimizes year-based search
+        # Define the aggregation pipeline over the precomputed per-year keyword counts
+        pipeline = [
+            { "$match": { "year": { "$gte": year } } },
+            { "$group": { "_id": "$keyword", "pubcnt": { "$sum": "$count" } } },
+            { "$sort": { "pubcnt": -1 } },
+            { "$limit": 10 },
+            { "$project": { "_id": 1, "pubcnt": 1 } }
+        ]
 
-        # Define the aggregation pipeline
+        # Execute the aggregation query (top-10 fits one batch; fail fast rather than spill to disk)
+        query_result = db[KEYWORD_YEAR_COUNTS].aggregate(pipeline, batchSize=10, allowDiskUse=False)
+        keywords = list(map(itemgetter("_id", "pubcnt"), query_result))  # [(keyword, count), ...]
+        if keywords:
+            return keywords
+
+        # Precomputed counts not built yet: aggregate over the publications directly
         pipeline = [
-            { "$unwind": "$keywords" },
             { "$match": { "year": { "$gte": year } } },
+            { "$unwind": "$keywords" },
             { "$group": { "_id": "$keywords.name", "pubcnt": { "$sum": 1 } } },
             { "$sort": { "pubcnt": -1 } },
             { "$limit": 10 },
             { "$project": { "_id": 1, "pubcnt": 1 } }
         ]
-
-        # Execute the aggregation query
-        query_result = list(db.publications.aggregate(pipeline))
-        return [(keyword["_id"], keyword["pubcnt"]) for keyword in query_result]  # [(keyword, count), ...]
+        query_result = db.publications.aggregate(pipeline, batchSize=10)
+        return list(map(itemgetter("_id", "pubcnt"), query_result))
     except Exception as e:
         print(f"Error fetching keywords since {year}:", e)
         return []
-    finally:
-        close_mongo_connection(client)
 
 
 # For 4. Widget Four: MongoDB Bar Chart
+@ttl_cached(_KRC_CACHE)
 def find_top_faculties_with_highest_KRC_keyword(keyword: str, affiliation: str) -> List[Tuple[str, int]]:
     """Find top faculties with the highest number of researchers working on the given keyword."""
-    client = None
     try:
-        client, db = get_mongo_connection()
-
-        # Create indexes for optimized query performance
-        db.faculty.create_index([("affiliation.name", 1)])  # Optimizes filtering
-        db.faculty.create_index([("publications", 1)])  # Optimizes lookup
-        db.publications.create_index([("id", 1)])  # Optimizes join
-        db.publications.create_index([("keywords.name", 1)])  # Optimizes keyword search
-        db.publications.create_index([("keywords.score", 1), ("numCitations", 1)])  # Optimizes calculations
+        db = get_db()
 
         # Define the aggregation pipeline
         pipeline = [
             { "$match": { "affiliation.name": affiliation } },
+            { "$project": { "_id": 0, "name": 1, "publications": 1 } },
             { "$lookup": {
                 "from": "publications",
                 "localField": "publications",
                 "foreignField": "id",
+                # Filter inside the lookup so only matching publications/keywords materialize
+                "pipeline": [
+                    { "$match": { "keywords.name": keyword } },
+                    { "$unwind": "$keywords" },
+                    { "$match": { "keywords.name": keyword } },  # Match the exact keyword
+                    { "$project": { "_id": 0, "score": "$keywords.score", "cites": "$numCitations" } }
+                ],
                 "as": "pubs"
             }},
             { "$unwind": "$pubs" },
-            { "$unwind": "$pubs.keywords" },
-            { "$match": { "pubs.keywords.name": keyword } },  # Match the exact keyword
             { "$group": {
                 "_id": "$name",
-                "KRC": { "$sum": { "$multiply": ["$pubs.keywords.score", "$pubs.numCitations"] } }
+                "KRC": { "$sum": { "$multiply": ["$pubs.score", "$pubs.cites"] } }
             }},
             { "$sort": { "KRC": -1 } },
             { "$limit": 10 },
@@ -167,88 +273,49 @@ def find_top_faculties_with_highest_KRC_keyword(keyword: str, affiliation: str)
         ]
 
         # Execute the aggregation query
-        query_result = list(db.faculty.aggregate(pipeline))
-        return [(faculty["_id"], faculty["KRC"]) for faculty in query_result]  # [(faculty, KRC), ...]
+        query_result = db.faculty.aggregate(pipeline, batchSize=10, allowDiskUse=False)
+        return list(map(itemgetter("_id", "KRC"), query_result))  # [(faculty, KRC), ...]
 
     except Exception as e:
         print(f"Error fetching faculties for keyword '{keyword}' and affiliation '{affiliation}':", e)
         return []
-    finally:
-        close_mongo_connection(client)
 
 
 # For 6. Widget Six: MongoDB Sunburst Chart - University Collaboration
+@ttl_cached(_QUERY_CACHE)
 def university_collaborate_with_mongo(university_name: str) -> List[Tuple[str, int]]:
     """Fetch institutes collaborating with a specific university from the MongoDB database."""
-    client = None
     try:
-        client, db = get_mongo_connection()
-
-        # Create indexes for optimized query performance
-        db.faculty.create_index([("affiliation.name", 1)])  # Optimizes filtering by university
-        db.faculty.create_index([("publications", 1)])  # Optimizes lookup by publications array
-
-        # First, get all publication IDs from faculty at the selected university (as a set)
-        faculty_from_uni = list(db.faculty.find(
-            { "affiliation.name": university_name },
-            { "publications": 1, "name": 1 }
-        ))
-
-        # Collect all unique publication IDs
-        publication_ids = set()
-        faculty_pub_map = {}  # Map publication_id -> set of faculty names
-        for faculty in faculty_from_uni:
-            faculty_name = faculty.get("name", "")
-            for pub_id in faculty.get("publications", []):
-                publication_ids.add(pub_id)
-                if pub_id not in faculty_pub_map:
-                    faculty_pub_map[pub_id] = set()
-                faculty_pub_map[pub_id].add(faculty_name)
-
-        if not publication_ids:
-            return []
-
-        # Now find all faculty who have any of these publications (excluding same university)
-        # Use a more efficient query with $in operator
-        collaborating_faculty = db.faculty.find(
-            {
-                "publications": { "$in": list(publication_ids) },
-                "affiliation.name": { "$ne": university_name }
-            },
-            { "name": 1, "affiliation.name": 1, "publications": 1 }
-        )
-
-        # Build collaboration map: university -> set of original faculty who collaborated
-        collaboration_map = {}  # university_name -> set of original faculty names
-        for faculty in collaborating_faculty:
-            collab_university = faculty.get("affiliation", {}).get("name", "")
-            if not collab_university:
-                continue
-
-            collab_publications = set(faculty.get("publications", []))
-            # Find which publications this faculty shares with original university
-            shared_pubs = collab_publications.intersection(publication_ids)
-
-            # For each shared publication, add all original faculty to the collaboration
-            for pub_id in shared_pubs:
-                if collab_university not in collaboration_map:
-                    collaboration_map[collab_university] = set()
-                collaboration_map[collab_university].update(faculty_pub_map.get(pub_id, set()))
-
-        # Convert to list of tuples and sort
-        result = [
-            (university, len(faculty_set))
-            for university, faculty_set in collaboration_map.items()
+        db = get_db()
+
+        # Define the aggregation pipeline: for each publication of the selected university's
+        # faculty, look up co-authors at other universities and count the distinct original
+        # faculty who collaborated with each of those universities
+        pipeline = [
+            { "$match": { "affiliation.name": university_name } },
+            { "$project": { "_id": 0, "name": 1, "publications": 1 } },
+            { "$unwind": "$publications" },
+            { "$lookup": {
+                "from": "faculty",
+                "localField": "publications",
+                "foreignField": "publications",
+                "pipeline": [{ "$project": { "_id": 0, "affiliation.name": 1 } }],
+                "as": "collabs"
+            }},
+            { "$unwind": "$collabs" },
+            { "$match": { "collabs.affiliation.name": { "$nin": [university_name, None, ""] } } },
+            { "$group": { "_id": "$collabs.affiliation.name", "faculty": { "$addToSet": "$name" } } },
+            { "$project": { "_id": 1, "count": { "$size": "$faculty" } } },
+            { "$sort": { "count": -1, "_id": 1 } },
+            { "$limit": 10 }
         ]
-        result.sort(key=lambda x: x[1], reverse=True)
 
-        # Return top 10
-        return result[:10]
+        # Execute the aggregation query
+        query_result = db.faculty.aggregate(pipeline, batchSize=10, allowDiskUse=False)
+        return list(map(itemgetter("_id", "count"), query_result))  # [(university, count), ...]
 
     except Exception as e:
         print(f"Error fetching collaboration data for '{university_name}':", e)
         import traceback
         traceback.print_exc()
         return []
-    finally:
-        close_mongo_connection(client)
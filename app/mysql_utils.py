@@ -3,15 +3,48 @@
 from typing import List, Tuple, Optional, Union, Any
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from cache_utils import ttl_cached, CACHE_LOCK
 import os
 from dotenv import load_dotenv
 import time
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env file
 load_dotenv(override=True)
 
+# Connection settings, resolved once at import
+_DB_CFG = {
+    "host": os.getenv("DB_HOST"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASSWORD"),
+    "database": os.getenv("DB_NAME"),
+    "port": int(os.getenv("DB_PORT", 3306)),
+    "connect_timeout": 30  # 30-second timeout
+}
+# Sized for the parallel query executor (half the pool) plus concurrent callbacks and the keep-alive thread
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "16"))
+
+# Process-wide connection pool (created lazily on first use)
+_POOL: Optional[MySQLConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+# In-process TTL caches: catalog lists rarely change, counts change on delete/restore
+_CATALOG_CACHE: TTLCache = TTLCache(maxsize=16, ttl=300)  # 5 minutes
+_COUNT_CACHE: TTLCache = TTLCache(maxsize=16, ttl=30)  # 30 seconds
+
+# Schema setup (indexes, soft-delete columns) only needs to be verified once per process
+_INDEXES_ENSURED = False
+_IS_DELETED_OK = {"faculty": False, "keyword": False}
+_COLUMN_LOCK = threading.Lock()  # Short column check, taken by the count/catalog getters
+_INDEX_LOCK = threading.Lock()  # Long index build, only taken by the analytic queries
+
 def _safe_int(value: Any, default: int = 0) -> int:
     """Safely convert a database value to int."""
     if value is None:
@@ -30,23 +63,36 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
     except (ValueError, TypeError):
         return default
 
+def _get_pool() -> MySQLConnectionPool:
+    """Return the process-wide MySQL connection pool, creating it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = MySQLConnectionPool(
+                pool_name="app",
+                pool_size=DB_POOL_SIZE,
+                pool_reset_session=False,
+                autocommit=True,  # Reads must not hold a snapshot open on a pooled connection
+                **_DB_CFG
+            )
+        return _POOL
+
+
 def get_db_connection() -> Any:
-    """Create and return a new connection to MySQL."""
+    """Check out a connection from the MySQL connection pool."""
     max_retries = 3
     retry_delay_seconds = 2
 
     for attempt in range(1, max_retries + 1):
         try:
-            connection = mysql.connector.connect(
-                host=os.getenv("DB_HOST"),
-                user=os.getenv("DB_USER"),
-                password=os.getenv("DB_PASSWORD"),
-                database=os.getenv("DB_NAME"),
-                port=int(os.getenv("DB_PORT", 3306)),
-                connect_timeout=30  # 30-second timeout
-            )
+            connection = _get_pool().get_connection()
             print(f"MySQL connection established (Attempt {attempt}/{max_retries})")
             return connection
+        except PoolError:
+            # Pool exhausted (get_connection() does not wait): open a one-off connection instead
+            # of sleeping; close() on it disconnects rather than returning it to the pool
+            print("MySQL connection pool exhausted, opening a direct connection")
+            return mysql.connector.connect(autocommit=True, **_DB_CFG)
         except Error as e:
             print(f"MySQL connection failed (Attempt {attempt}/{max_retries}): {e}")
             if attempt < max_retries:
@@ -61,13 +107,102 @@ def get_db_connection() -> Any:
 
 
 def close_db_connection(cursor: Optional[Any], cnx: Optional[Any]) -> None:
-    """Safely close MySQL cursor and connection."""
-    if cursor:
-        cursor.close()
-    if cnx:
-        cnx.close()
+    """Safely close MySQL cursor and return the connection to the pool."""
+    try:
+        if cursor:
+            cursor.close()
+    finally:
+        # Always hand the connection back, even if closing the cursor raised (e.g. unread result)
+        if cnx:
+            cnx.close()
+
+
+def _invalidate_cached(*func_names: str) -> None:
+    """Drop the cached results of the given zero-argument query functions."""
+    with CACHE_LOCK:
+        for func_name in func_names:
+            _CATALOG_CACHE.pop(hashkey(func_name), None)
+            _COUNT_CACHE.pop(hashkey(func_name), None)
+
+
+def _ensure_indexes(cursor: Any) -> None:
+    """Create the indexes used by the widget queries (runs once per process)."""
+    global _INDEXES_ENSURED
+    if _INDEXES_ENSURED:  # Fast path without the lock once the indexes are in place
+        return
+
+    with _INDEX_LOCK:
+        if _INDEXES_ENSURED:
+            return
+
+        # faculty.is_deleted and keyword.is_deleted are part of indexes below
+        _ensure_is_deleted_column(cursor, "faculty")
+        _ensure_is_deleted_column(cursor, "keyword")
+
+        index_definitions = {
+            "idx_publication_year": "CREATE INDEX idx_publication_year ON publication(year);",
+            "idx_pubkw_pubid_kwid": "CREATE INDEX idx_pubkw_pubid_kwid ON publication_keyword(publication_id, keyword_id);",
+            "idx_pubkw_kwid": "CREATE INDEX idx_pubkw_kwid ON publication_keyword(keyword_id);",
+            "idx_keyword_id": "CREATE INDEX idx_keyword_id ON keyword(id);",
+            "idx_keyword_name": "CREATE INDEX idx_keyword_name ON keyword(name, is_deleted);",
+            "idx_university_name": "CREATE INDEX idx_university_name ON university(name);",
+            "idx_fp_fac_pub": "CREATE INDEX idx_fp_fac_pub ON faculty_publication(faculty_Id, publication_Id);",
+            "idx_fp_pub_fac": "CREATE INDEX idx_fp_pub_fac ON faculty_publication(publication_Id, faculty_Id);",
+            "idx_faculty_univ_deleted": "CREATE INDEX idx_faculty_univ_deleted ON faculty(university_id, is_deleted);"
+        }
+
+        # Look up all existing indexes in one round-trip
+        index_names = list(index_definitions.keys())
+        placeholders = ", ".join(["%s"] * len(index_names))
+        cursor.execute(f"""
+            SELECT DISTINCT index_name FROM INFORMATION_SCHEMA.STATISTICS
+            WHERE table_schema = DATABASE()
+            AND index_name IN ({placeholders})
+        """, index_names)
+        existing_indexes = {str(row[0]) for row in cursor.fetchall()}
+
+        for index_name, index_sql in index_definitions.items():
+            if index_name not in existing_indexes:
+                try:
+                    cursor.execute(index_sql)
+                except Exception as index_error:
+                    print(f"Index creation failed for {index_name}:", index_error)
+
+        # Unlike the is_deleted column, a missing index only slows queries down, so a failed
+        # CREATE INDEX is not retried on every query (it would re-run a long DDL each time)
+        _INDEXES_ENSURED = True
+
 
+def _ensure_is_deleted_column(cursor: Any, table_name: str) -> None:
+    """Add the soft-delete 'is_deleted' column to the table if missing (checked once per process)."""
+    if _IS_DELETED_OK[table_name]:  # Fast path without the lock once the column is confirmed
+        return
+
+    with _COLUMN_LOCK:
+        if _IS_DELETED_OK[table_name]:
+            return
+
+        cursor.execute("""
+            SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS 
+            WHERE TABLE_SCHEMA = DATABASE() 
+            AND TABLE_NAME = %s 
+            AND COLUMN_NAME = 'is_deleted'
+        """, (table_name,))
+        result = cursor.fetchone()
+        column_exists = (_safe_int(result[0]) > 0) if result else False
 
+        if not column_exists:
+            try:
+                cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN is_deleted BOOLEAN DEFAULT FALSE")
+                print(f"Added is_deleted column to {table_name} table")
+            except Exception as alter_error:
+                print(f"Error adding is_deleted column to {table_name} table: {alter_error}")
+                return  # Continue even if column creation fails; retry on next call (queries filter on it)
+
+        _IS_DELETED_OK[table_name] = True
+
+
+@ttl_cached(_CATALOG_CACHE)
 def get_all_tables() -> List[str]:
     """Fetch all table names from the MySQL database."""
     cnx, cursor = None, None
@@ -108,21 +243,19 @@ def find_universities_with_faculties_working_keywords(keyword: str) -> List[Tupl
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
-        # Create a View to store the top universities with faculty count
-        query_view = """CREATE OR REPLACE VIEW TOP_UNIVERSITIES AS
-                        SELECT university.name, COUNT(distinct(faculty.id)) AS faculty_count
-                        FROM university, faculty, faculty_keyword, keyword
-                        WHERE university.id = faculty.university_id
-                        AND faculty.id = faculty_keyword.faculty_id
-                        AND faculty_keyword.keyword_id = keyword.id
-                        AND keyword.name LIKE %s
-                        GROUP BY university.name;"""
-        cursor.execute(query_view, (f"%{keyword}%",))  # Secure way to pass parameters
-        cnx.commit()
+        # Create indexes for optimized query performance (first call only)
+        _ensure_indexes(cursor)
 
-        # Query the view to fetch top universities with faculty count
-        query = "SELECT * FROM TOP_UNIVERSITIES ORDER BY faculty_count DESC LIMIT 5"
-        cursor.execute(query)
+        # Fetch top universities with faculty count in a single query
+        query = """SELECT university.name, COUNT(DISTINCT faculty.id) AS faculty_count
+                   FROM university
+                   INNER JOIN faculty ON university.id = faculty.university_id
+                   INNER JOIN faculty_keyword ON faculty.id = faculty_keyword.faculty_id
+                   INNER JOIN keyword ON faculty_keyword.keyword_id = keyword.id
+                   WHERE keyword.name LIKE %s
+                   GROUP BY university.name
+                   ORDER BY faculty_count DESC LIMIT 5;"""
+        cursor.execute(query, (f"%{keyword}%",))  # Secure way to pass parameters
 
         results = cursor.fetchall()
         return [(str(row[0]), _safe_int(row[1])) for row in results]  # [(university, faculty_count), ...]
@@ -141,27 +274,7 @@ def find_most_popular_keywords_sql(year: int) -> List[Tuple[str, int]]:
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
-        # Create indexes for optimized query performance
-        index_definitions = {
-            "idx_publication_year": "CREATE INDEX idx_publication_year ON publication(year);",
-            "idx_pubkw_pubid_kwid": "CREATE INDEX idx_pubkw_pubid_kwid ON publication_keyword(publication_id, keyword_id);",
-            "idx_pubkw_kwid": "CREATE INDEX idx_pubkw_kwid ON publication_keyword(keyword_id);",
-            "idx_keyword_id": "CREATE INDEX idx_keyword_id ON keyword(id);"
-        }
-
-        for index_name, index_sql in index_definitions.items():
-            cursor.execute("""
-                SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS
-                WHERE table_schema = DATABASE()
-                AND index_name = %s
-            """, (index_name,))
-            result = cursor.fetchone()
-            exists = _safe_int(result[0]) if result else 0
-            if not exists:
-                try:
-                    cursor.execute(index_sql)
-                except Exception as index_error:
-                    print(f"Index creation failed for {index_name}:", index_error)
+        _ensure_indexes(cursor)
 
         query = """SELECT keyword.name, COUNT(publication.id)
                    FROM keyword, publication_keyword, publication
@@ -180,15 +293,22 @@ def find_most_popular_keywords_sql(year: int) -> List[Tuple[str, int]]:
 
 
 # For 2. Widget Two: MySQL Controller
+@ttl_cached(_CATALOG_CACHE)
 def get_all_keywords() -> List[str]:
     """Fetch all keywords from the MySQL database."""
     cnx, cursor = None, None
     try:
         cnx = get_db_connection()
         cursor = cnx.cursor()
-        cursor.execute("SELECT DISTINCT(name) FROM keyword")
-        results = cursor.fetchall()
-        return [str(keyword[0]) for keyword in results]  # (keyword,) -> keyword
+
+        # The is_deleted filter below needs the soft-delete column (checked once per process)
+        _ensure_is_deleted_column(cursor, "keyword")
+
+        # Covering (name, is_deleted) index returns names already ordered, so no sort is needed
+        cursor.execute("""SELECT DISTINCT name FROM keyword
+                          WHERE is_deleted IS NULL OR is_deleted = FALSE
+                          ORDER BY name""")
+        return [str(keyword[0]) for keyword in cursor]  # (keyword,) -> keyword, streamed row by row
     except Exception as e:
         print("Error fetching keywords:", e)
         return []
@@ -202,34 +322,22 @@ def find_faculty_relevant_to_keyword(keyword: str) -> List[Tuple[str, str, str]]
     cnx, cursor = None, None
     try:
         cnx = get_db_connection()
-        cursor = cnx.cursor()
+        cursor = cnx.cursor(prepared=True)
 
-        # Prepared Statement: define the SQL statement with a placeholder
+        # Prepared Statement: the query is sent once with a placeholder (COM_STMT_PREPARE)
+        # and executed with the bound parameter (COM_STMT_EXECUTE)
         # Benefit: avoid SQL injection and improve performance
-        prepare_query = """PREPARE stmt FROM 
-                           'SELECT faculty.id, faculty.name, university.name
-                            FROM university, faculty, faculty_keyword, keyword
-                            WHERE university.id = faculty.university_id
-                            AND faculty.id = faculty_keyword.faculty_id
-                            AND faculty_keyword.keyword_id = keyword.id
-                            AND keyword.name = ? 
-                            AND faculty_keyword.score >= 50
-                            AND faculty.is_deleted = FALSE';"""
-        # Prepare the statement
-        cursor.execute(prepare_query)
-
-        # Assign value to the parameter
-        cursor.execute("SET @keyword = %s", (keyword,))
-
-        # Execute the prepared statement using the variable
-        cursor.execute("EXECUTE stmt USING @keyword;")
-
-        # Fetch results
+        query = """SELECT faculty.id, faculty.name, university.name
+                   FROM university, faculty, faculty_keyword, keyword
+                   WHERE university.id = faculty.university_id
+                   AND faculty.id = faculty_keyword.faculty_id
+                   AND faculty_keyword.keyword_id = keyword.id
+                   AND keyword.name = %s
+                   AND faculty_keyword.score >= 50
+                   AND faculty.is_deleted = FALSE"""
+        cursor.execute(query, (keyword,))
         results = cursor.fetchall()
 
-        # Deallocate the prepared statement
-        cursor.execute("DEALLOCATE PREPARE stmt;")
-
         return [(str(row[0]), str(row[1]), str(row[2])) for row in results]  # [(faculty_id, faculty_name, university_name), ...]
     except Exception as e:
         print("Error fetching faculty members:", e)
@@ -239,6 +347,7 @@ def find_faculty_relevant_to_keyword(keyword: str) -> List[Tuple[str, str, str]]
 
 
 # For 3.1 Widget Three: MySQL Table - Count Faculty
+@ttl_cached(_COUNT_CACHE)
 def get_faculty_count() -> int:
     """Fetch the total number of faculty members from the MySQL database."""
     cnx, cursor = None, None
@@ -246,23 +355,8 @@ def get_faculty_count() -> int:
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
-        # Check if 'is_deleted' column exists (case-insensitive check)
-        cursor.execute("""
-            SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = DATABASE() 
-            AND TABLE_NAME = 'faculty' 
-            AND COLUMN_NAME = 'is_deleted'
-        """)
-        result = cursor.fetchone()
-        column_exists = (_safe_int(result[0]) > 0) if result else False
-
-        if not column_exists:
-            try:
-                cursor.execute("ALTER TABLE faculty ADD COLUMN is_deleted BOOLEAN DEFAULT FALSE")
-                cnx.commit()
-            except Exception as alter_error:
-                print(f"Error adding column: {alter_error}")
-                # Continue even if column creation fails
+        # Ensure 'is_deleted' column exists
+        _ensure_is_deleted_column(cursor, "faculty")
 
         cursor.execute("SELECT COUNT(*) FROM faculty WHERE is_deleted = FALSE")
         result = cursor.fetchone()
@@ -290,6 +384,7 @@ def delete_faculty(faculty_id: int) -> bool:
 
         # Commit transaction to finalize changes
         cnx.commit()
+        _invalidate_cached("get_faculty_count")
         return True
 
     except Exception as e:
@@ -306,28 +401,20 @@ def delete_faculty(faculty_id: int) -> bool:
 
 # For 3.3 Widget Three: MySQL Table - Restore Faculty
 def restore_faculty() -> bool:
-    """Restore all faculty members by setting is_deleted back to FALSE using a Transaction."""
+    """Restore all faculty members by setting is_deleted back to FALSE."""
     cnx, cursor = None, None
     try:
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
-        # Start transaction
-        cnx.start_transaction()
-
-        # Restore all soft-deleted faculty members
+        # Restore all soft-deleted faculty members (a single UPDATE is atomic on its own)
         cursor.execute("UPDATE faculty SET is_deleted = FALSE WHERE is_deleted = TRUE")
-
-        # Commit transaction to finalize changes
         cnx.commit()
+        _invalidate_cached("get_faculty_count")
         return True
 
     except Exception as e:
         print("Error restoring faculty members:", e)
-
-        # Rollback transaction in case of failure
-        if cnx:
-            cnx.rollback()
         return False
 
     finally:
@@ -335,15 +422,17 @@ def restore_faculty() -> bool:
 
 
 # For 4.1 Widget Four: MongoDB Bar Chart (with MySQL option) - Database Dropdown
+@ttl_cached(_CATALOG_CACHE)
 def get_all_universities() -> List[str]:
     """Fetch all universities from the MySQL database."""
     cnx, cursor = None, None
     try:
         cnx = get_db_connection()
         cursor = cnx.cursor()
-        cursor.execute("SELECT DISTINCT(name) FROM university")
-        results = cursor.fetchall()
-        return [str(university[0]) for university in results]  # (university,) -> university
+
+        # Index on name returns names already ordered, so no sort is needed
+        cursor.execute("SELECT DISTINCT name FROM university ORDER BY name")
+        return [str(university[0]) for university in cursor]  # (university,) -> university, streamed row by row
     except Exception as e:
         print("Error fetching universities:", e)
         return []
@@ -359,16 +448,18 @@ def find_top_faculties_with_highest_KRC_keyword_sql(keyword: str, university: st
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
-        # Query the view to fetch top faculties with highest KRC
+        _ensure_indexes(cursor)
+
+        # Join chain anchored on keyword.name so MySQL can drive from the keyword index
         query = """SELECT faculty.name, 
                    ROUND(SUM(publication_keyword.score * publication.num_citations), 2) AS KRC
-                   FROM faculty, faculty_publication, publication, publication_keyword, keyword, university
-                   WHERE faculty.id = faculty_publication.faculty_Id
-                   AND faculty_publication.publication_Id = publication.ID
-                   AND publication.ID = publication_keyword.publication_id
-                   AND publication_keyword.keyword_id = keyword.id
-                   AND keyword.name = %s
-                   AND faculty.university_id = university.id
+                   FROM keyword
+                   INNER JOIN publication_keyword ON publication_keyword.keyword_id = keyword.id
+                   INNER JOIN publication ON publication.ID = publication_keyword.publication_id
+                   INNER JOIN faculty_publication ON faculty_publication.publication_Id = publication.ID
+                   INNER JOIN faculty ON faculty.id = faculty_publication.faculty_Id
+                   INNER JOIN university ON university.id = faculty.university_id
+                   WHERE keyword.name = %s
                    AND university.name = %s
                    GROUP BY faculty.id ORDER BY KRC DESC LIMIT 10;
                    """
@@ -390,19 +481,27 @@ def faculty_interested_in_keywords_mysql(university_name: str) -> List[Tuple[str
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
+        _ensure_indexes(cursor)
+
         # Query to get top 10 keywords by faculty count for a given university
         # Join: university -> faculty -> faculty_keyword -> keyword
-        query = """SELECT keyword.id, keyword.name, COUNT(DISTINCT faculty.id) AS faculty_count
-                   FROM university
-                   INNER JOIN faculty ON university.id = faculty.university_id
-                   INNER JOIN faculty_keyword ON faculty.id = faculty_keyword.faculty_id
-                   INNER JOIN keyword ON faculty_keyword.keyword_id = keyword.id
-                   WHERE university.name = %s
-                   AND faculty.is_deleted = FALSE
-                   AND (keyword.is_deleted IS NULL OR keyword.is_deleted = FALSE)
-                   GROUP BY keyword.id, keyword.name
-                   ORDER BY faculty_count DESC
-                   LIMIT 10"""
+        # Derived table picks the top 10 keyword ids for that university's faculty only,
+        # so the sort runs over per-keyword counts and keyword names are joined for 10 rows
+        query = """SELECT keyword.id, keyword.name, top_keywords.faculty_count
+                   FROM (
+                       SELECT faculty_keyword.keyword_id, COUNT(DISTINCT faculty.id) AS faculty_count
+                       FROM faculty
+                       INNER JOIN faculty_keyword ON faculty.id = faculty_keyword.faculty_id
+                       INNER JOIN keyword ON faculty_keyword.keyword_id = keyword.id
+                       WHERE faculty.university_id IN (SELECT id FROM university WHERE name = %s)
+                       AND faculty.is_deleted = FALSE
+                       AND (keyword.is_deleted IS NULL OR keyword.is_deleted = FALSE)
+                       GROUP BY faculty_keyword.keyword_id
+                       ORDER BY faculty_count DESC
+                       LIMIT 10
+                   ) AS top_keywords
+                   INNER JOIN keyword ON keyword.id = top_keywords.keyword_id
+                   ORDER BY top_keywords.faculty_count DESC"""
         cursor.execute(query, (university_name,))
         results = cursor.fetchall()
         return [(str(row[0]), str(row[1]), _safe_int(row[2])) for row in results]  # [(id, keyword, count), ...]
@@ -416,6 +515,7 @@ def faculty_interested_in_keywords_mysql(university_name: str) -> List[Tuple[str
 
 
 # For 5.2 Widget Five: MySQL Table - Count Keywords (Keeping Neo4j for now, MySQL alternative available)
+@ttl_cached(_COUNT_CACHE)
 def get_keyword_count_mysql() -> int:
     """Get the total number of keywords in the MySQL database (excluding deleted ones)."""
     cnx, cursor = None, None
@@ -423,23 +523,8 @@ def get_keyword_count_mysql() -> int:
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
-        # Check if 'is_deleted' column exists in keyword table
-        cursor.execute("""
-            SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = DATABASE() 
-            AND TABLE_NAME = 'keyword' 
-            AND COLUMN_NAME = 'is_deleted'
-        """)
-        result = cursor.fetchone()
-        column_exists = (_safe_int(result[0]) > 0) if result else False
-
-        if not column_exists:
-            try:
-                cursor.execute("ALTER TABLE keyword ADD COLUMN is_deleted BOOLEAN DEFAULT FALSE")
-                cnx.commit()
-            except Exception as alter_error:
-                print(f"Error adding is_deleted column to keyword table: {alter_error}")
-                # Continue even if column creation fails
+        # Ensure 'is_deleted' column exists in keyword table
+        _ensure_is_deleted_column(cursor, "keyword")
 
         # Count active (non-deleted) keywords
         cursor.execute("SELECT COUNT(*) FROM keyword WHERE is_deleted IS NULL OR is_deleted = FALSE")
@@ -454,90 +539,32 @@ def get_keyword_count_mysql() -> int:
 
 # For 5.3 Widget Five: MySQL Table - Delete Keywords (Keeping Neo4j for now, MySQL alternative available)
 def delete_keyword_mysql(keyword_id: str) -> bool:
-    """Soft delete a keyword from the MySQL database using a Transaction."""
+    """Soft delete a keyword from the MySQL database."""
     cnx, cursor = None, None
     try:
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
-        # First, ensure is_deleted column exists (do this separately to avoid transaction issues)
-        cursor.execute("""
-            SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = DATABASE() 
-            AND TABLE_NAME = 'keyword' 
-            AND COLUMN_NAME = 'is_deleted'
-        """)
-        result = cursor.fetchone()
-        column_exists = (_safe_int(result[0]) > 0) if result else False
-
-        if not column_exists:
-            try:
-                cursor.execute("ALTER TABLE keyword ADD COLUMN is_deleted BOOLEAN DEFAULT FALSE")
-                cnx.commit()
-            except Exception as alter_error:
-                print(f"Error adding is_deleted column to keyword table: {alter_error}")
-                # Continue even if column creation fails
-                # If there was an error, ensure we're in a clean state
-                try:
-                    cnx.rollback()
-                except:
-                    pass
+        # First, ensure is_deleted column exists
+        _ensure_is_deleted_column(cursor, "keyword")
 
         # Validate keyword_id
         if not keyword_id or keyword_id.strip() == "":
             print(f"Invalid keyword_id: empty or None")
             return False
 
-        # Now handle the delete operation
-        # Try converting to int first (most MySQL IDs are integers)
-        keyword_id_int = None
-        try:
-            keyword_id_int = int(keyword_id)
-        except (ValueError, TypeError):
-            pass  # Keep as string if conversion fails
-
-        # Ensure we're not in a transaction before starting a new one
-        try:
-            # Try to start transaction, but if one is already in progress, rollback first
-            cnx.start_transaction()
-        except Exception as tx_error:
-            # If transaction already in progress, rollback and try again
-            if "already in progress" in str(tx_error).lower():
-                cnx.rollback()
-                cnx.start_transaction()
-            else:
-                raise
-
-        # Soft delete the keyword - try int first, then string
-        rows_affected = 0
-        if keyword_id_int is not None:
-            cursor.execute("UPDATE keyword SET is_deleted = TRUE WHERE id = %s", (keyword_id_int,))
-            rows_affected = cursor.rowcount
-            if rows_affected == 0:
-                # If int didn't work, try as string
-                cnx.rollback()
-                # Start a new transaction for the string attempt
-                try:
-                    cnx.start_transaction()
-                except Exception as tx_error:
-                    if "already in progress" in str(tx_error).lower():
-                        cnx.rollback()
-                        cnx.start_transaction()
-                    else:
-                        raise
-                cursor.execute("UPDATE keyword SET is_deleted = TRUE WHERE id = %s", (keyword_id,))
-                rows_affected = cursor.rowcount
-        else:
-            cursor.execute("UPDATE keyword SET is_deleted = TRUE WHERE id = %s", (keyword_id,))
-            rows_affected = cursor.rowcount
+        # Soft delete the keyword with a single atomic UPDATE; comparing against the string
+        # form lets MySQL match both integer and string id columns (and still use the index)
+        cursor.execute("UPDATE keyword SET is_deleted = TRUE WHERE id = %s", (keyword_id.strip(),))
+        rows_affected = cursor.rowcount
 
         if rows_affected > 0:
             cnx.commit()
+            _invalidate_cached("get_keyword_count_mysql", "get_all_keywords")
             print(f"Successfully deleted keyword with id: {keyword_id}")
             return True
         else:
-            cnx.rollback()
-            print(f"No keyword found with id: {keyword_id} (tried as {'int and string' if keyword_id_int is not None else 'string'})")
+            print(f"No keyword found with id: {keyword_id}")
             return False
 
     except Exception as e:
@@ -553,74 +580,33 @@ def delete_keyword_mysql(keyword_id: str) -> bool:
 
 # For 5.4 Widget Five: MySQL Table - Restore Keywords (Keeping Neo4j for now, MySQL alternative available)
 def restore_keyword_mysql() -> bool:
-    """Restore all deleted keywords in the MySQL database using a Transaction."""
+    """Restore all deleted keywords in the MySQL database."""
     cnx, cursor = None, None
     try:
         cnx = get_db_connection()
         cursor = cnx.cursor()
 
-        # Check if 'is_deleted' column exists
-        cursor.execute("""
-            SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = DATABASE() 
-            AND TABLE_NAME = 'keyword' 
-            AND COLUMN_NAME = 'is_deleted'
-        """)
-        result = cursor.fetchone()
-        column_exists = (_safe_int(result[0]) > 0) if result else False
+        # Ensure 'is_deleted' column exists (cached after the first check)
+        _ensure_is_deleted_column(cursor, "keyword")
 
-        if not column_exists:
-            # If column doesn't exist, ensure it exists first
-            try:
-                cursor.execute("ALTER TABLE keyword ADD COLUMN is_deleted BOOLEAN DEFAULT FALSE")
-                cnx.commit()
-                print("Added is_deleted column to keyword table")
-            except Exception as alter_error:
-                print(f"Error adding is_deleted column to keyword table: {alter_error}")
-                # If there was an error, ensure we're in a clean state
-                try:
-                    cnx.rollback()
-                except:
-                    pass
-            # No keywords to restore if column didn't exist
-            return True
-
-        # Start transaction - handle case where transaction is already in progress
-        try:
-            cnx.start_transaction()
-        except Exception as tx_error:
-            # If transaction already in progress, rollback and try again
-            if "already in progress" in str(tx_error).lower():
-                cnx.rollback()
-                cnx.start_transaction()
-            else:
-                raise
-
-        # Restore all soft-deleted keywords by setting is_deleted = FALSE
+        # Restore all soft-deleted keywords (a single UPDATE is atomic on its own)
         cursor.execute("UPDATE keyword SET is_deleted = FALSE WHERE is_deleted = TRUE")
-
-        rows_affected = cursor.rowcount
-        print(f"Restored {rows_affected} keyword(s)")
-
-        # Commit transaction to finalize changes
+        print(f"Restored {cursor.rowcount} keyword(s)")
         cnx.commit()
+        _invalidate_cached("get_keyword_count_mysql", "get_all_keywords")
         return True
 
     except Exception as e:
         print(f"Error restoring keywords: {e}")
         import traceback
         traceback.print_exc()
-
-        # Rollback transaction in case of failure
-        if cnx:
-            cnx.rollback()
         return False
     finally:
         close_db_connection(cursor, cnx)
 
 
 # For 6.2 Widget Six: Neo4j Sunburst Chart - University Information
-def get_university_information(university_name: str) -> List[Tuple[str, int, str]]:
+def get_university_information(university_name: str) -> Optional[Tuple[str, int, str]]:
     """Fetch university information based on the university name."""
     cnx, cursor = None, None
     try:
@@ -631,17 +617,24 @@ def get_university_information(university_name: str) -> List[Tuple[str, int, str
                    FROM university, faculty
                    WHERE university.name = %s
                    AND university.id = faculty.university_id
-                   GROUP BY university.name, university.photo_url;"""
+                   GROUP BY university.name, university.photo_url
+                   LIMIT 1;"""
         cursor.execute(query, (university_name,))
-        results = cursor.fetchall()
-        return [(str(row[0]), _safe_int(row[1]), str(row[2]) if row[2] else "") for row in results]  # [(name, faculty_count, photo_url), ...]
+        row = cursor.fetchone()
+        return (str(row[0]), _safe_int(row[1]), str(row[2]) if row[2] else "") if row else None  # (name, faculty_count, photo_url)
     except Exception as e:
         print("Error fetching university information:", e)
-        return []
+        return None
     finally:
         close_db_connection(cursor, cnx)
 
 
+# Reuse one HTTP session so the per-minute Aiven ping keeps its TCP/TLS connection alive
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1,
+                                       max_retries=Retry(total=2, backoff_factor=0.5)))
+
+
 def ping_aiven_service() -> None:
     """Ping Aiven control-plane API to keep the service active."""
     token = os.getenv("AIVEN_API_TOKEN")
@@ -653,13 +646,13 @@ def ping_aiven_service() -> None:
         return
 
     url = f"https://api.aiven.io/v1/project/{project}/service/{service}"
-    headers = {
+    _SESSION.headers.update({
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
-    }
+    })
 
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = _SESSION.get(url, timeout=10)
         if resp.status_code == 200:
             print(f"Aiven API keep-alive ping successful at {time.ctime()}")
         else:
@@ -675,24 +668,19 @@ def start_mysql_keep_alive() -> None:
 
     def keep_alive_loop() -> None:
         while True:
-            cnx, cursor = None, None
+            cnx = None
             try:
                 # ---- MySQL ping ----
+                # COM_PING a pooled connection; the handshake only recurs if the server dropped it
                 cnx = get_db_connection()
-                cursor = cnx.cursor()
-                cursor.execute("SELECT 1 AS ping")
-                result = cursor.fetchone()
-
-                if result and result[0] == 1:
-                    print(f"MySQL keep-alive ping successful at {time.ctime()}")
-                else:
-                    print(f"MySQL keep-alive ping unexpected result at {time.ctime()}")
+                cnx.ping(reconnect=True, attempts=3, delay=2)
+                print(f"MySQL keep-alive ping successful at {time.ctime()}")
 
             except Exception as e:
                 print(f"MySQL keep-alive ping failed at {time.ctime()}: {e}")
 
             finally:
-                close_db_connection(cursor, cnx)
+                close_db_connection(None, cnx)
 
             # ---- Aiven API ping ----
             ping_aiven_service()
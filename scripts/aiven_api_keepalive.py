@@ -1,6 +1,13 @@
 import os
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Reuse one HTTP session so repeated pings share the TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1,
+                                       max_retries=Retry(total=2, backoff_factor=0.5)))
 
 
 def ping_aiven_service() -> None:
@@ -14,13 +21,13 @@ def ping_aiven_service() -> None:
         return
 
     url = f"https://api.aiven.io/v1/project/{project}/service/{service}"
-    headers = {
+    _SESSION.headers.update({
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
-    }
+    })
 
     try:
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = _SESSION.get(url, timeout=30)
         if resp.status_code == 200:
             print(f"Aiven API keep-alive ping successful at {time.ctime()}")
         else:
@@ -27,15 +27,11 @@ def main() -> None:
                 ssl={"check_hostname": True},
             )
             try:
-                with conn.cursor() as cur:
-                    cur.execute("SELECT 1 AS ping;")
-                    row = cur.fetchone()
+                # COM_PING: protocol-level liveness check, no SQL parsing on the server
+                conn.ping(reconnect=False)
             finally:
                 conn.close()
 
-            if not row or row[0] != 1:
-                raise RuntimeError(f"Unexpected ping result: {row}")
-
             print(f"Aiven MySQL keep-alive succeeded at {time.ctime()} (attempt {attempt}).")
             return
 
@@ -0,0 +1,18 @@
+import os
+import sys
+import time
+
+# Reuse the app's MongoDB helpers
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from mongodb_utils import get_db, refresh_keyword_year_counts, KEYWORD_YEAR_COUNTS
+
+
+def main() -> None:
+    db = get_db(build_missing=False)  # This script does the rebuild itself
+    refresh_keyword_year_counts(db)
+    print(f"Refreshed '{KEYWORD_YEAR_COUNTS}' ({db[KEYWORD_YEAR_COUNTS].estimated_document_count()} rows) at {time.ctime()}.")
+
+
+if __name__ == "__main__":
+    main()